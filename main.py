@@ -4,16 +4,17 @@ import os
 import sys
 import time
 import multiprocessing
+from pathlib import Path
 from PyQt6.QtWidgets import ( # pylint: disable=no-name-in-module
     QApplication, QMainWindow, QStackedWidget, QWidget, QLabel, QVBoxLayout
 )
 from PyQt6.QtGui import QFontDatabase, QIcon, QPixmap # pylint: disable=no-name-in-module
-from PyQt6.QtCore import QDir, QThread, pyqtSignal, QObject # pylint: disable=no-name-in-module
+from PyQt6.QtCore import QDir, QThread, pyqtSignal, QObject, Qt # pylint: disable=no-name-in-module
 from guitaraoke.scoring_system import ScoringSystem
 from guitaraoke.practice_window import PracticeWindow
 from guitaraoke.setup_window import SetupWindow
 from guitaraoke.audio_streaming import AudioStreamHandler, LoadedAudio
-from guitaraoke.utils import read_config
+from guitaraoke.utils import read_config, read_stylesheet
 from guitaraoke.preload import preload_directories
 
 
@@ -33,14 +34,28 @@ class LoadingWindow(QWidget):
         self.loading_image.setFixedSize(
             self.gui_config["min_width"], self.gui_config["min_height"]
         )
-        self.loading_pixmap = QPixmap(f"{os.environ['assets_dir']}\\images\\loading_screen.png")
+        self.loading_pixmap = QPixmap(
+            str(Path(os.environ["assets_dir"]) / "images" / "loading_screen.png")
+        )
         self.loading_image.setPixmap(self.loading_pixmap)
 
+        # Current loading stage shown over the bottom of the image
+        self.status_label = QLabel(self.loading_image)
+        self.status_label.setGeometry(
+            0, self.gui_config["min_height"] - 60, self.gui_config["min_width"], 30
+        )
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.setStyleSheet(f"color: {self.gui_config['theme_colour']};")
+
         layout = QVBoxLayout()
         layout.addWidget(self.loading_image)
 
         self.setLayout(layout)
 
+    def set_status(self, stage: str) -> None:
+        """Display the current song loading stage."""
+        self.status_label.setText(stage)
+
 
 class MainWindow(QMainWindow):
     """The main window of the GUI application."""
@@ -52,7 +67,9 @@ class MainWindow(QMainWindow):
 
         self.scorer = ScoringSystem()
 
-        self.setWindowIcon(QIcon(f"{os.environ['assets_dir']}\\images\\guitar_pick.png"))
+        self.setWindowIcon(QIcon(
+            str(Path(os.environ["assets_dir"]) / "images" / "guitar_pick.png")
+        ))
 
         self.setWindowTitle("Guitaraoke")
 
@@ -75,12 +92,8 @@ class MainWindow(QMainWindow):
 
     def set_styles(self) -> dict[str, str]:
         """Sets the CSS styling of the window and widgets."""
-        with open(
-            f"{os.environ['assets_dir']}\\stylesheets\\main.qss", "r", encoding="utf-8"
-        ) as f:
-            # Read main stylesheet and set main window style
-            _style = f.read()
-            self.setStyleSheet(_style)
+        # Set main window style from the main stylesheet
+        self.setStyleSheet(read_stylesheet("main"))
 
     def launch_practice_mode(self, song_data: tuple[str, str, str]) -> None:
         """
@@ -97,6 +110,7 @@ class MainWindow(QMainWindow):
             self.worker = SongLoader(song_data)
             self.worker.moveToThread(self.loading_thread)
             self.loading_thread.started.connect(self.worker.run)
+            self.worker.progress.connect(self.loading_window.set_status)
             self.worker.loaded.connect(self.song_loaded)
             self.worker.loaded.connect(self.loading_thread.quit)
             self.worker.loaded.connect(self.worker.deleteLater)
@@ -146,6 +160,7 @@ class MainWindow(QMainWindow):
 
 class SongLoader(QObject):
     """Worker object that performs song loading."""
+    progress = pyqtSignal(str)
     loaded = pyqtSignal(AudioStreamHandler)
 
     def __init__(self, song_data: tuple[str, str, str]) -> None:
@@ -161,7 +176,8 @@ class SongLoader(QObject):
             LoadedAudio(
                 path=path,
                 title=title,
-                artist=artist
+                artist=artist,
+                progress=self.progress.emit
             )
         )
         self.loaded.emit(audio)
@@ -171,11 +187,13 @@ def main() -> None:
     """Run the application."""
 
     # Add path to find images in stylesheet
-    QDir.addSearchPath("images", f"{os.environ['assets_dir']}\\images")
+    QDir.addSearchPath("images", str(Path(os.environ["assets_dir"]) / "images"))
 
     # Initialise the application and add the font
     app = QApplication(sys.argv)
-    QFontDatabase.addApplicationFont(f"{os.environ['assets_dir']}\\fonts\\Roboto-Regular.ttf")
+    QFontDatabase.addApplicationFont(
+        str(Path(os.environ["assets_dir"]) / "fonts" / "Roboto-Regular.ttf")
+    )
 
     main_window = MainWindow()
     main_window.show()
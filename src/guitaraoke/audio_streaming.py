@@ -1,6 +1,11 @@
 """
 Provides classes for audio streaming and playback functionality.
 
+Functions
+---------
+load_metronome(rate)
+    Return the metronome click's audio time series.
+
 Classes
 -------
 LoadedAudio()
@@ -11,20 +16,41 @@ AudioStreamHandler()
 """
 
 import os
+import sys
+import ctypes
+import json
 import time
-from configparser import ConfigParser
+import shutil
+import queue
+import threading
+import functools
+import concurrent.futures
 from pathlib import Path
+from typing import Callable
 import librosa
 import numpy as np
-import pandas as pd
 import sounddevice as sd
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer # pylint: disable=no-name-in-module
 from guitaraoke.save_notes import save_notes
 from guitaraoke.separate_guitar import separate_guitar
 from guitaraoke.utils import (
-    csv_to_notes_dataframe, preprocess_note_data, read_config
+    csv_to_notes_arrays, file_hash, load_wav, load_wav_mmap,
+    preprocess_note_data, read_config, write_config
 )
 
+DEFAULT_BPM = 120.0 # Used when no tempo can be detected in a song
+
+@functools.cache
+def load_metronome(rate: int) -> np.ndarray:
+    """
+    Return the metronome click's audio time series, loaded once per
+    process and shared read-only between AudioStreamHandler instances.
+    """
+    click = load_wav(Path(os.environ["assets_dir"]) / "audio" / "metronome.wav", rate)
+    click.flags.writeable = False
+    return click
+
+
 class LoadedAudio():
     """
     Contains all necessary data received from an audio file such as its
@@ -34,14 +60,25 @@ class LoadedAudio():
     ----------
     metadata : dict[str, str]
         The song's title, artist, and filename stored in a dictionary.
-    guitar_data, no_guitar_data : ndarray
-        The song's separated tracks' audio time series.
-    notes : DataFrame
-        The guitar note events predicted from the song in a DataFrame.
+    sep_dir : Path
+        The directory of the song's separated tracks and saved
+        metadata.
+    guitar_data, no_guitar_data : memmap
+        The song's separated tracks' audio time series, memory-mapped
+        from saved .npy files.
+    full_mix : memmap
+        The sum of the separated tracks' audio time series, played
+        when the guitar track is at full volume, memory-mapped from a
+        saved .npy file.
+    notes : dict[str, ndarray]
+        The guitar note events predicted from the song as parallel
+        start, end, and pitch arrays sorted by note onset.
     bpm : float
         The song's tempo.
     first_beat : float
         The estimated time position of the song's first beat onset.
+    length : int
+        The length of the song in frames.
     duration : float
         The length of the song in seconds.
     """
@@ -49,7 +86,8 @@ class LoadedAudio():
         self,
         path: str | Path,
         title: str = "Unknown",
-        artist: str = "Unknown"
+        artist: str = "Unknown",
+        progress: Callable[[str], None] | None = None
     ) -> None:
         """
         The constructor for the LoadedAudio class.
@@ -62,61 +100,211 @@ class LoadedAudio():
             The title given to the loaded audio file.
         artist : str, default="Unknown"
             The artist attributed to the loaded audio file.
+        progress : Callable[[str], None] | None, default=None
+            A function called with a description of each loading stage
+            as it begins.
         """
         assert isinstance(path, (Path, str)), "File path should be a string or pathlib Path"
         path = Path(path)
         assert path.exists(), "File does not exist"
 
         self.audio_config = read_config("Audio")
+        if np.dtype(self.audio_config["dtype"]).kind != "f":
+            # Tracks and the metronome click are float samples in [-1, 1]
+            raise ValueError("Audio dtype must be a float type, e.g. float32.")
+        self._progress = progress
 
         self.metadata = {
             "title": title,
             "artist": artist,
             "filename": path.stem
         }
-        self.notes, self.guitar_data, self.no_guitar_data = self._get_audio_data(path)
-        self.bpm, self.first_beat = self._get_tempo_data()
-        self.duration = len(self.guitar_data) / self.audio_config["rate"] # In secs
+        # Directory of the song's separated tracks and saved metadata
+        self.sep_dir = Path(os.environ["sep_tracks_dir"]) / path.stem
+        (self.notes, self.guitar_data, self.no_guitar_data,
+         self.full_mix, (self.bpm, self.first_beat)) = self._get_audio_data(path)
+        self.length = len(self.guitar_data) # In frames
+        self.duration = self.length / self.audio_config["rate"] # In secs
 
     def _get_audio_data(
         self,
         path: Path
-    ) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    ) -> tuple[
+        dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, tuple[float, float]
+    ]:
         """
-        Load a song's predicted notes DataFrame and its separated
-        audio time series (guitar_data and no_guitar_data).
+        Load a song's predicted note event arrays, its separated audio
+        time series (guitar_data and no_guitar_data), their full mix,
+        and its tempo data.
         """
-        audio_dir = Path(f"{os.environ['sep_tracks_dir']}\\{self.metadata['filename']}")
-        guitar_path = audio_dir / "guitar.wav"
-        no_guitar_path = audio_dir / "no_guitar.wav"
+        meta = self._get_cached_meta(path)
+
+        # Perform guitar separation (skipped if tracks already saved)
+        if not self.sep_dir.exists():
+            self._report_progress("Separating guitar track...")
+        guitar_path, no_guitar_path = separate_guitar(path)
+        # Record which file the tracks were separated from straight away,
+        # so they are kept if loading fails after this point
+        meta = self._save_meta(path, meta)
+        self._report_progress("Detecting notes and tempo...")
+
+        # Note detection and decoding of the two tracks are independent,
+        # so run them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            notes_future = executor.submit(
+                lambda: csv_to_notes_arrays(save_notes(guitar_path)[0])
+            )
+            guitar_data, no_guitar_data, full_mix = self._load_tracks(
+                executor, guitar_path, no_guitar_path
+            )
+
+            # Beat tracking only needs the full mix, so overlap it with
+            # note detection
+            tempo_future = executor.submit(self._get_tempo_data, full_mix, meta)
 
-        # Perform guitar separation and note detection
-        guitar_path, no_guitar_data = separate_guitar(path)
-        notes_path = save_notes(guitar_path)[0]
+        notes, (bpm, first_beat) = notes_future.result(), tempo_future.result()
 
-        # Convert notes CSV to a pandas DataFrame
-        notes = csv_to_notes_dataframe(notes_path)
+        # Tracks are decoded as float32, so convert them up front if the
+        # stream uses another float dtype (loading them into memory) to
+        # keep casts out of the audio callback
+        dtype = np.dtype(self.audio_config["dtype"])
+        if guitar_data.dtype != dtype:
+            guitar_data, no_guitar_data, full_mix = (
+                np.ascontiguousarray(data, dtype=dtype)
+                for data in (guitar_data, no_guitar_data, full_mix)
+            )
 
-        # Get guitar and no_guitar tracks' audio time series
-        guitar_data = librosa.load(guitar_path, sr=self.audio_config["rate"])[0]
-        no_guitar_data = librosa.load(no_guitar_path, sr=self.audio_config["rate"])[0]
+        # Mark saved song data as complete and made from this file
+        self._save_meta(
+            path, meta,
+            rate=self.audio_config["rate"], bpm=float(bpm), first_beat=float(first_beat)
+        )
 
-        return notes, guitar_data, no_guitar_data
+        return notes, guitar_data, no_guitar_data, full_mix, (bpm, first_beat)
 
-    def _get_tempo_data(self) -> tuple[float, float]:
+    def _load_tracks(
+        self,
+        executor: concurrent.futures.Executor,
+        guitar_path: Path,
+        no_guitar_path: Path
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decode the separated tracks concurrently using the given
+        executor and return them memory-mapped with their full mix,
+        which is saved next to the tracks on first load.
+        """
+        rate = self.audio_config["rate"]
+        guitar_future = executor.submit(load_wav_mmap, guitar_path, rate)
+        no_guitar_future = executor.submit(load_wav_mmap, no_guitar_path, rate)
+        guitar_data, no_guitar_data = guitar_future.result(), no_guitar_future.result()
+
+        mix_path = guitar_path.with_name("full_mix.npy")
+        if not mix_path.exists():
+            np.save(mix_path, np.add(guitar_data, no_guitar_data))
+        return guitar_data, no_guitar_data, np.load(mix_path, mmap_mode="r")
+
+    def _save_meta(self, path: Path, meta: dict, **values) -> dict:
+        """
+        Save the song's metadata, recording the identity of the audio
+        file its saved data was made from along with any given values,
+        and return it. The file is only written if the metadata changed.
+        """
+        source_stat = path.stat()
+        new_meta = {
+            **meta,
+            "source_hash": meta.get("source_hash") or file_hash(path),
+            "source_mtime": source_stat.st_mtime_ns,
+            "source_size": source_stat.st_size,
+            **values
+        }
+        if new_meta != meta:
+            with open(self.sep_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(new_meta, f)
+        return new_meta
+
+    def _report_progress(self, stage: str) -> None:
+        """Send a loading stage description to the progress function."""
+        if self._progress is not None:
+            self._progress(stage)
+
+    def _get_cached_meta(self, path: Path) -> dict:
+        """
+        Return the song's saved metadata if its saved data was made
+        from the given audio file. Tracks saved without metadata (e.g.
+        by an earlier version) are kept, returning an empty dict so the
+        file is recorded as their source. Otherwise, delete any saved
+        tracks and notes under the song's filename, as they belong to a
+        different or changed file, and return an empty dict.
+        """
+        sep_dir = self.sep_dir
+        meta_path = sep_dir / "meta.json"
+        if meta_path.exists():
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+
+            # Only hash the file if it was modified or replaced since
+            # its data was saved
+            source_stat = path.stat()
+            unchanged = (meta.get("source_mtime") == source_stat.st_mtime_ns
+                         and meta.get("source_size") == source_stat.st_size)
+            if unchanged or meta.get("source_hash") == file_hash(path):
+                if meta.get("rate") != self.audio_config["rate"]:
+                    # Decoded .npy tracks are at a different sample rate
+                    for npy_path in sep_dir.glob("*.npy"):
+                        npy_path.unlink()
+                return meta
+        elif all((sep_dir / name).exists() for name in ("guitar.wav", "no_guitar.wav")):
+            # Case: tracks saved without metadata, so keep them but
+            # decode them again, as their decoded sample rate is unknown
+            for npy_path in sep_dir.glob("*.npy"):
+                npy_path.unlink()
+            return {}
+
+        # Case: saved data is stale or incomplete
+        shutil.rmtree(sep_dir, ignore_errors=True)
+        shutil.rmtree(
+            Path(os.environ["saved_notes_dir"]) / "songs" / self.metadata["filename"],
+            ignore_errors=True
+        )
+        return {}
+
+    def _get_tempo_data(self, mix: np.ndarray, meta: dict) -> tuple[float, float]:
         """
         Find a song's predicted BPM and the estimated time position of 
-        its first beat.
+        its first beat, reading them from the song's saved metadata if
+        available.
         """
+        if meta.get("bpm", 0) > 0:
+            return meta["bpm"], meta["first_beat"]
+
+        # Beat tracking finds no tempo in very quiet audio, so scale
+        # quiet songs up to a usable RMS level before analysis
+        rms = float(np.sqrt(np.mean(np.square(mix, dtype=np.float32))))
+        if 0 < rms < 1e-3:
+            mix = mix * np.float32(0.1 / rms)
+
         tempo, beats = librosa.beat.beat_track(
-            y=self.guitar_data + self.no_guitar_data, # Full mix
+            y=mix,
             sr=self.audio_config["rate"]
         )
-        bpm = tempo[0]
-        first_beat = librosa.frames_to_time(beats[0]) * 1000 # In ms
+        bpm = float(np.atleast_1d(tempo)[0])
+
+        # Case: no beats found (e.g. silent audio), so fall back to a
+        # default tempo starting at the beginning of the song
+        if bpm <= 0 or beats.size == 0:
+            return DEFAULT_BPM, 0.0
+
+        first_beat = float(librosa.frames_to_time(beats[0])) * 1000 # In ms
 
         return bpm, first_beat
 
+    def active_notes(self, seconds: float) -> np.ndarray:
+        """Return the MIDI pitches of all song notes sounding at a time."""
+        # Only notes with an onset before the given time can be sounding
+        hi = np.searchsorted(self.notes["start"], seconds, side="right")
+        sounding = self.notes["end"][:hi] > seconds
+        return self.notes["pitch"][:hi][sounding]
+
 
 class AudioStreamHandler(QObject):
     """
@@ -126,13 +314,23 @@ class AudioStreamHandler(QObject):
     ----------
     song : LoadedAudio
         A LoadedAudio instance containing song data such as its audio
-        time series and notes DataFrame.
-    rec_buffer : ndarray
-        An ndarray that acts as a circular buffer containing 2 seconds
-        of user audio data sent to the practice window for scoring.
-    rec_overlap_window : ndarray
-        An ndarray that containing recorded input audio data pushed to
-        the rec_buffer when a full second of audio has been added.
+        time series and note event arrays.
+    rec_chunks : ndarray
+        A circular buffer of overlap-window-sized chunks of user audio
+        data. The latest full chunks make up the 2 second buffer sent
+        to the practice window for scoring, with one spare chunk being
+        written to while the others are read.
+    rec_slot : int
+        The index of the rec_chunks chunk currently being written to.
+    rec_filled : int
+        The number of samples written to the current chunk (sent for
+        scoring when a full second has been added).
+    rec_sent : int
+        The number of chunks sent for scoring since the buffers were
+        last reset, showing whether the sent buffer is fully recorded.
+    rec_queue : SimpleQueue
+        Recorded buffers waiting to be prepared for scoring by the
+        rec_worker thread, keeping that work off the audio callback.
     paused, ended : bool
         The current state of audio playback's paused and ended status.
     stream : Stream
@@ -159,54 +357,95 @@ class AudioStreamHandler(QObject):
         self.audio_config = read_config("Audio")
 
         # Input variables
-        self._rec_buffer = np.zeros(self.audio_config["rec_buffer_size"]) # Input audio buffer
-        self._rec_overlap_window = np.ndarray(0) # Input audio overlap window
+        self._rate = self.audio_config["rate"]
+        self._overlap_size = self.audio_config["rec_overlap_window_size"] # For callback
+        self._rec_chunks = np.zeros( # Input audio circular chunk buffer
+            (self.audio_config["rec_buffer_size"] // self._overlap_size + 1,
+             self._overlap_size),
+            dtype=self.audio_config["dtype"]
+        )
+        self._rec_slot = 0
+        self._rec_filled = 0
+        self._rec_sent = 0 # Chunks sent since buffers were reset
+        self._rec_reset = False # Set to reset the buffers in the callback
+
+        # Recording worker thread, prepares buffers for scoring
+        self._rec_queue = queue.SimpleQueue()
+        self._rec_worker = threading.Thread(target=self._process_rec_buffers, daemon=True)
+        self._rec_worker.start()
 
         # Playback data
         self._paused = True
         self._ended = True
         self._position = 0
         self._guitar_volume = 1.0
-        self.loop_markers = [None,None]
+        self._loop_markers = (None, None)
+        self._loop_start, self._loop_end = -1, -1 # Int copies for callback
         self.looping = False
 
         # Metronome data
         self.metronome = {
-            "audio_data": librosa.load(
-                f"{os.environ['assets_dir']}\\audio\\metronome.wav",
-                sr=self.audio_config["rate"]
-            )[0],
+            "audio_data": load_metronome(self._rate),
             "count_in_enabled": True,
             "count": 0,
             "interval": int(1000 / (self.song.bpm / 60))
         }
 
-        # I/O Stream
+        # Metronome click read position, mixed into the stream output
+        # (starts at the end: silent)
+        self._click_pos = self.metronome["audio_data"].size
+
+        # I/O Stream (block size grows if output underruns persist)
+        self._blocksize = self.audio_config["blocksize"]
+        self._underruns = 0
+        self._thread_prioritised = False
+        self._stream = None
+        self._open_stream()
+
+    def _open_stream(self) -> None:
+        """
+        Open the sounddevice I/O stream at the current block size and
+        write the resultant stream latency values to the config file.
+        """
         self._stream = sd.Stream(
-            samplerate=self.audio_config["rate"],
+            samplerate=self._rate,
+            blocksize=self._blocksize,
             device=(self.audio_config["input_device_index"], None),
             channels=(self.audio_config["channels"], self.audio_config["channels"]),
             callback=self._callback,
             dtype=self.audio_config["dtype"],
-            latency="low",
+            latency=self.audio_config["latency"], # Rounded up by host API if too low
         )
 
         in_lat, out_lat = self._stream.latency
         print(
+            f"Block Size: {self._blocksize} frames\n"
             f"Input Latency: {in_lat*1000:.1f}ms\n"
             f"Output Latency: {out_lat*1000:.1f}ms"
         )
 
-        # Update config file
-        parser = ConfigParser()
-        parser.read("data\\config.ini")
+        # Write current stream latency values to config, only if they
+        # have changed
+        saved_config = read_config("Audio")
+        if (abs(saved_config["in_latency"] - in_lat) > 1e-4
+            or abs(saved_config["out_latency"] - out_lat) > 1e-4):
+            write_config("Audio", {"in_latency": in_lat, "out_latency": out_lat})
 
-        # Write current stream latency values to config
-        parser.set("Audio", "in_latency", str(in_lat))
-        parser.set("Audio", "out_latency", str(out_lat))
-
-        with open("data\\config.ini", "w", encoding="utf-8") as configfile:
-            parser.write(configfile)
+    def _tune_latency(self) -> None:
+        """
+        Double the stream's block size (up to the configured maximum)
+        if output underruns have persisted since the last start. Only
+        called when the stream starts, as reopening it mid-playback
+        would cause a gap, so underruns during continuous playback
+        only take effect once playback is paused and resumed.
+        """
+        underruns, self._underruns = self._underruns, 0
+        if (underruns < self.audio_config["underrun_limit"]
+            or self._blocksize >= self.audio_config["max_blocksize"]):
+            return
+        self._blocksize = min(self._blocksize * 2, self.audio_config["max_blocksize"])
+        self._stream.close()
+        self._open_stream()
 
     @property
     def position(self) -> int:
@@ -237,12 +476,12 @@ class AudioStreamHandler(QObject):
 
     def seek(self, position: float) -> None:
         """Set the position to a new time in seconds."""
-        if not (0 <= int(position * self.audio_config["rate"])
-                <= int(self.song.duration * self.audio_config["rate"])):
+        new_position = int(position * self._rate) # In frames
+        if not 0 <= new_position <= self.song.length:
             raise ValueError("Position must be between 0 and song duration.")
         if self._ended:
             self._ended = False
-        self._position = int(position * self.audio_config["rate"])
+        self._position = new_position
         # Reset buffers when audio skipped
         self.zero_buffers()
 
@@ -252,10 +491,34 @@ class AudioStreamHandler(QObject):
         if self._ended: # Reset position to start of song
             self._position = 0
             self._ended = False
-        self._paused = False
-        self._stream.start()
         # Reset buffers when audio started
         self.zero_buffers()
+        self._paused = False
+        self._start_stream() # Already running if counted in
+
+    def _start_stream(self) -> None:
+        """Start the stream if it is stopped, tuning its latency first."""
+        if self._stream.active:
+            return
+        self._tune_latency()
+        self._thread_prioritised = False # Callback thread may be new
+        self._stream.start()
+
+    def _raise_thread_priority(self) -> None:
+        """
+        Give the calling audio callback thread real-time priority
+        where the OS allows it, reducing scheduling jitter.
+        """
+        try:
+            if sys.platform == "win32":
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(
+                    kernel32.GetCurrentThread(), 15 # THREAD_PRIORITY_TIME_CRITICAL
+                )
+            else: # 0 is the calling thread on Linux
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+        except (AttributeError, OSError):
+            pass # Unsupported or not permitted, keep default priority
 
     def stop(self) -> None:
         """Pause audio stream."""
@@ -267,95 +530,171 @@ class AudioStreamHandler(QObject):
     def abort_stream(self) -> None:
         """Immediately terminate audio processing."""
         self._stream.abort()
+        self._rec_queue.put(None) # Stop the recording worker
 
     def _callback(self, indata, outdata, frames, t, status) -> None: # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
         """Callback function for the sounddevice Stream."""
+        if not self._thread_prioritised:
+            self._raise_thread_priority()
+            self._thread_prioritised = True
+
         if status: # Print callback flags if any
             print(f"Stream callback flags: {status}", flush=True)
+            if status.output_underflow:
+                self._underruns += 1
 
         # INPUT HANDLING
 
-        self._rec_overlap_window = np.append(
-            self._rec_overlap_window, indata.copy()
-        )
-
-        if self._rec_overlap_window.size >= self.audio_config["rec_overlap_window_size"]:
-            perf_time_start = time.perf_counter()
-            overlap_size = self.audio_config["rec_overlap_window_size"]
-            # Add new overlap buffered data to main buffer, and push main
-            # buffer to the left by rec_overlap_window_size
-            self._rec_buffer = np.append(
-                self._rec_buffer,
-                self._rec_overlap_window[:overlap_size]
-            )
-            self._rec_buffer = self._rec_buffer[overlap_size:]
-
-            # Remove data added to main buffer from overlap window buffer
-            self._rec_overlap_window = self._rec_overlap_window[overlap_size:]
+        # Apply a buffer reset requested from the GUI thread before
+        # this block is written, so recording state is never reset
+        # part way through a write
+        if self._rec_reset:
+            self._rec_reset = False
+            self._reset_rec_buffers()
 
-            # Only take note data from song time-slice equal to size
-            # of data currently in the buffer to avoid negatively
-            # impacting user accuracy
-            if not np.any(self._rec_buffer[:overlap_size]):
-                slice_start = (self._position-overlap_size)/self.audio_config["rate"]
-            else:
-                slice_start = ((self._position-self.audio_config["rec_buffer_size"])
-                               /self.audio_config["rate"])
-
-            # Send audio buffer data, position, and song notes
-            # to connected function in main file for scoring
-            notes = preprocess_note_data(
-                self.song.notes,
-                slice_start=slice_start,
-                slice_end=self._position/self.audio_config["rate"],
-            )
-            self.new_input_buffer_signal.emit(
-                (self._rec_buffer.copy(), self._position, notes, perf_time_start)
-            )
+        # Only record while the song is playing, not during count-in
+        if not self._paused:
+            self._record(indata, frames)
 
         # OUTPUT HANDLING
 
-        new_pos = self._position + frames
-
         # Case: audio should not be playing
         if self._paused or self._ended:
-            # Set outdata to zeros
-            outdata[:frames] = np.zeros((frames,1))
-            return
+            # Set outdata to zeros in place
+            outdata[:frames].fill(0)
+        else:
+            self._play(outdata, frames)
+
+        # Mix any playing metronome click on top of the output
+        click = self.metronome["audio_data"]
+        click_pos = self._click_pos
+        if click_pos < click.size:
+            n = min(frames, click.size - click_pos)
+            outdata[:n, 0] += click[click_pos:click_pos+n]
+            self._click_pos = click_pos + n
+
+    def _record(self, indata: np.ndarray, frames: int) -> None:
+        """
+        Write a block of recorded input into the rec_chunks buffer,
+        sending each chunk for scoring when it fills.
+        """
+        # PortAudio's input buffer is valid for the whole callback, so it
+        # is written into the chunk buffer directly without a copy
+        assert indata.flags["C_CONTIGUOUS"] and indata.dtype == self._rec_chunks.dtype
+        in_samples = indata[:, 0]
+        filled = self._rec_filled
+        to_boundary = self._overlap_size - filled
+        if frames < to_boundary:
+            self._rec_chunks[self._rec_slot, filled:filled+frames] = in_samples
+            self._rec_filled += frames
+        else:
+            # Fill the chunk up to the overlap boundary and send it for
+            # scoring, keeping the rest of the block for the next chunk
+            self._rec_chunks[self._rec_slot, filled:] = in_samples[:to_boundary]
+            self._send_rec_buffer()
+            self._rec_slot = (self._rec_slot + 1) % len(self._rec_chunks)
+            self._rec_filled = frames - to_boundary
+            self._rec_chunks[self._rec_slot, :self._rec_filled] = in_samples[to_boundary:]
+
+    def _play(self, outdata: np.ndarray, frames: int) -> None:
+        """
+        Write the next block of the song into the output buffer,
+        wrapping to the loop start or ending playback as needed.
+        """
+        # Cache values used throughout as locals
+        pos = self._position
+        new_pos = pos + frames
+        loop_start, loop_end = self._loop_start, self._loop_end
 
         # Case: song looping and end of loop is reached in this batch
-        if self.in_loop_bounds() and new_pos >= self.loop_markers[1]:
-            overflow_frames = new_pos - self.loop_markers[1]
+        if self.looping and loop_start < pos < loop_end <= new_pos:
+            overflow_frames = new_pos - loop_end
             # Set new pos to correct position after loop
-            new_pos = self.loop_markers[0] + overflow_frames
-
-            # Get all frames before right loop marker, and concatenate
-            # with all frames needed after loop
-            guitar_batch = np.concatenate((
-                self.song.guitar_data[self._position:self.loop_markers[1]],
-                self.song.guitar_data[self.loop_markers[0]:new_pos]
-            ))
-            no_guitar_batch = np.concatenate((
-                self.song.no_guitar_data[self._position:self.loop_markers[1]],
-                self.song.no_guitar_data[self.loop_markers[0]:new_pos]
-            ))
+            new_pos = loop_start + overflow_frames
+            pre_loop_frames = frames - overflow_frames
+
+            # Write all frames before right loop marker, followed by all
+            # frames needed after loop
+            self._write_mix(outdata[:pre_loop_frames, 0], pos, loop_end)
+            self._write_mix(outdata[pre_loop_frames:frames, 0], loop_start, new_pos)
         else:
             # Case: no looping and end of song is reached in this batch
-            if new_pos >= len(self.song.guitar_data):
-                new_pos = len(self.song.guitar_data)
-                frames = new_pos - self._position
+            length = self.song.length
+            if new_pos >= length:
+                new_pos = length
+                outdata[new_pos-pos:frames].fill(0) # Silence past the end
+                frames = new_pos - pos
                 self._ended = True
 
-            # No looping, load guitar and no_guitar batches as normal
-            guitar_batch = self.song.guitar_data[self._position:new_pos]
-            no_guitar_batch = self.song.no_guitar_data[self._position:new_pos]
-
-        # Sum the amplitudes of the two tracks to get full mix values
-        audio_batch = (guitar_batch * self._guitar_volume) + no_guitar_batch
-        outdata[:frames] = audio_batch.reshape(-1,1)
+            # No looping, write the batch as normal
+            self._write_mix(outdata[:frames, 0], pos, new_pos)
 
         self._position = new_pos # Update song position
 
+    def _write_mix(self, out: np.ndarray, start: int, end: int) -> None:
+        """
+        Write the mix of the song's frames from start to end into an
+        output buffer, scaling the guitar track by its volume.
+        """
+        if self._guitar_volume == 1.0:
+            # Full mix is precomputed, so only a copy is needed
+            out[:] = self.song.full_mix[start:end]
+        else:
+            # Sum the amplitudes of the two tracks to get full mix values,
+            # writing straight into the output to avoid temporary arrays
+            np.multiply(self.song.guitar_data[start:end], self._guitar_volume, out=out)
+            np.add(out, self.song.no_guitar_data[start:end], out=out)
+
+    def _send_rec_buffer(self) -> None:
+        """
+        Queue the index of the newly-filled rec_chunks chunk and the
+        song position for the recording worker thread. No audio is
+        copied, as the callback only writes to the next chunk.
+        """
+        self._rec_sent += 1
+        self._rec_queue.put_nowait(
+            (self._rec_slot, self._position, self._rec_sent, time.perf_counter())
+        )
+
+    def _process_rec_buffers(self) -> None:
+        """
+        Recording worker thread loop. Prepares each queued buffer and
+        its song notes, then sends them to the connected function for
+        scoring. Exits when None is queued.
+        """
+        overlap_size = self._overlap_size
+        rec_buffer_size = self.audio_config["rec_buffer_size"]
+        inv_rate = 1 / self._rate
+        num_slots = len(self._rec_chunks)
+
+        while (item := self._rec_queue.get()) is not None:
+            slot, position, chunks_sent, perf_time_start = item
+
+            # Join the latest full chunks, oldest first
+            buffer = self._rec_chunks[
+                [(slot - i) % num_slots for i in range(num_slots-2, -1, -1)]
+            ].reshape(-1)
+
+            # Only take note data from song time-slice equal to size
+            # of data currently in the buffer (still partly zeroed if
+            # fewer chunks than it holds were sent since the last reset)
+            # to avoid negatively impacting user accuracy
+            if chunks_sent < num_slots - 1:
+                slice_start = (position-overlap_size) * inv_rate
+            else:
+                slice_start = (position-rec_buffer_size) * inv_rate
+
+            # Send audio buffer data, position, and song notes
+            # to connected function in main file for scoring
+            notes = preprocess_note_data(
+                self.song.notes,
+                slice_start=slice_start,
+                slice_end=position * inv_rate,
+            )
+            self.new_input_buffer_signal.emit(
+                (buffer, position, notes, perf_time_start)
+            )
+
     def play_count_in_metronome(self, count_in_timer: QTimer) -> None:
         """
         Play the count-in metronome sound and increment the metronome's
@@ -374,18 +713,35 @@ class AudioStreamHandler(QObject):
             self.metronome["count"] = 0
             return True # Start song
 
-        sd.play(self.metronome["audio_data"], samplerate=self.audio_config["rate"])
+        self._click_pos = 0 # Play click from its start
+        self._start_stream() # Stream stays running into playback
         return False # Keep counting
 
+    @property
+    def loop_markers(self) -> tuple[int | None, int | None]:
+        """Getter for the left and right loop marker positions in frames."""
+        return self._loop_markers
+
+    def set_loop_markers(self, left: int | None, right: int | None) -> None:
+        """Set the left and right loop marker positions in frames."""
+        self._loop_markers = (left, right)
+        self._loop_start = -1 if left is None else left
+        self._loop_end = -1 if right is None else right
+
     def in_loop_bounds(self) -> bool:
         """Check playback is looping and within loop marker bounds."""
-        if self.looping:
-            if (self._position > self.loop_markers[0]
-            and self._position < self.loop_markers[1]):
-                return True
-        return False
+        return self.looping and self._loop_start < self._position < self._loop_end
 
     def zero_buffers(self) -> None:
-        """Reset buffers when audio is restarted or skipped."""
-        self._rec_buffer = np.zeros(self.audio_config["rec_buffer_size"])
-        self._rec_overlap_window = np.ndarray(0)
+        """
+        Reset buffers when audio is restarted or skipped. The reset is
+        applied by the stream callback at the start of its next block.
+        """
+        self._rec_reset = True
+
+    def _reset_rec_buffers(self) -> None:
+        """Zero the recording chunk buffer and its write state."""
+        self._rec_chunks.fill(0)
+        self._rec_slot = 0
+        self._rec_filled = 0
+        self._rec_sent = 0
@@ -1,6 +1,5 @@
 """Provides a class for GUI audio playback control functionality."""
 
-import numpy as np
 from PyQt6.QtCore import Qt, pyqtSignal, QObject # pylint: disable=no-name-in-module
 from guitaraoke.audio_streaming import AudioStreamHandler
 from guitaraoke.utils import time_format, read_config
@@ -41,38 +40,52 @@ class PlaybackControls(QObject):
         self.widgets = widgets
         self.styles = styles
 
+        # Values reused on every 16ms audiopos_timer tick
+        self._duration_label = self.widgets["duration_label"]
+        self._playhead = self.widgets["playhead"]
+        self._set_duration_text = self._duration_label.setText
+        self._move_playhead = self._playhead.move
+        self._rate = self.audio_config["rate"]
+        self._inv_rate = 1 / self._rate
+        self._last_cs = -1 # Centisecond last shown on the duration label
+        # Pixels of waveform per second of song
+        self._sec_to_px = self.widgets["waveform"].width / self.audio.song.duration
+        self._px_to_sec = 1 / self._sec_to_px
+        self._px_to_frames = self._px_to_sec * self._rate
+        self._loop_styles_active = None # Loop styles last applied (None if unset)
+
     def update_song_pos(self) -> None:
-        """Updates song_duration label and moves playhead every 10ms."""
+        """Updates song_duration label and moves playhead every 16ms."""
+        song_pos_in_s = self.audio.position*self._inv_rate
         if self.audio.ended:
             # Stop time progressing when song ends
             self.pause_button_pressed()
 
             # Reset song time display to 0
-            self.widgets["duration_label"].setText(
-                f"<font color='{self.gui_config['theme_colour']}'>00:00.00</font>"
-                f" / {time_format(self.audio.song.duration)}"
-            )
+            self._set_duration_text("00:00.00")
+            self._last_cs = -1
         else:
-            # Update the song duration label with new time
-            self.widgets["duration_label"].setText(
-                f"<font color='{self.gui_config['theme_colour']}'>"
-                f"{time_format(self.audio.position/self.audio_config['rate'])}</font>"
-                f" / {time_format(self.audio.song.duration)}"
-            )
-        self.update_playhead_pos()
-
-    def update_playhead_pos(self) -> None:
+            # Only update the song duration label when the displayed
+            # time would change
+            cs = int(song_pos_in_s * 100)
+            if cs != self._last_cs:
+                self._last_cs = cs
+                self._set_duration_text(time_format(song_pos_in_s))
+        self.update_playhead_pos(song_pos_in_s)
+
+    def update_playhead_pos(self, song_pos_in_s: float) -> None:
         """
         Set playhead position relative to current song playback 
         position.
         """
-        song_pos_in_s = self.audio.position/self.audio_config["rate"]
-        head_pos = int((song_pos_in_s/self.audio.song.duration)
-                        * self.widgets["waveform"].width)
-        if head_pos < self.widgets["playhead"].x():
+        head_pos = int(song_pos_in_s * self._sec_to_px)
+        prev_head_pos = self._playhead.x()
+        if head_pos == prev_head_pos:
+            return # Avoid scheduling a geometry update for no movement
+        if head_pos < prev_head_pos:
             # Reset score data if looping
             self.reset_score_signal.emit()
-        self.widgets["playhead"].move(head_pos, 2)
+        self._move_playhead(head_pos, 2)
 
     def play_button_pressed(self) -> None:
         """Starts count-in timer when play button pressed."""
@@ -133,8 +146,8 @@ class PlaybackControls(QObject):
         # Prevent position from running over end of loop or end of song
         end = self.audio.song.duration
         if self.audio.in_loop_bounds():
-            end = self.audio.loop_markers[1]/self.audio_config["rate"]
-        pos_in_s = self.audio.position/self.audio_config["rate"]
+            end = self.audio.loop_markers[1]*self._inv_rate
+        pos_in_s = self.audio.position*self._inv_rate
 
         if pos_in_s + 5 < end:
             self.audio.seek(pos_in_s + 5)
@@ -149,8 +162,8 @@ class PlaybackControls(QObject):
         # Prevent position from falling behind start of loop or start of song
         start = 0
         if self.audio.in_loop_bounds():
-            start = self.audio.loop_markers[0]/self.audio_config["rate"]
-        pos_in_s = self.audio.position/self.audio_config["rate"]
+            start = self.audio.loop_markers[0]*self._inv_rate
+        pos_in_s = self.audio.position*self._inv_rate
 
         if pos_in_s - 5 > start:
             self.audio.seek(pos_in_s - 5)
@@ -171,14 +184,23 @@ class PlaybackControls(QObject):
         self.audio.looping = not self.audio.looping
         if self.audio.looping:
             self.widgets["loop_overlay"].show()
-            self.widgets["loop_button"].setStyleSheet(self.styles["active_loop_button"])
-            self.widgets["left_marker_img"].setStyleSheet(self.styles["active_marker"])
-            self.widgets["right_marker_img"].setStyleSheet(self.styles["active_marker"])
         else:
             self.widgets["loop_overlay"].hide()
-            self.widgets["loop_button"].setStyleSheet(self.styles["inactive_loop_button"])
-            self.widgets["left_marker_img"].setStyleSheet(self.styles["inactive_marker"])
-            self.widgets["right_marker_img"].setStyleSheet(self.styles["inactive_marker"])
+        self.set_loop_styles(self.audio.looping)
+
+    def set_loop_styles(self, active: bool) -> None:
+        """
+        Apply active or inactive styles to the loop button and markers,
+        skipping the restyle if they are already applied.
+        """
+        if active == self._loop_styles_active:
+            return
+        self._loop_styles_active = active
+
+        state = "active" if active else "inactive"
+        self.widgets["loop_button"].setStyleSheet(self.styles[f"{state}_loop_button"])
+        self.widgets["left_marker_img"].setStyleSheet(self.styles[f"{state}_marker"])
+        self.widgets["right_marker_img"].setStyleSheet(self.styles[f"{state}_marker"])
 
     def waveform_pressed(self, mouse_event) -> None:
         """
@@ -186,7 +208,7 @@ class PlaybackControls(QObject):
         Sets a loop marker if shift button held. Otherwise, if left
         mouse pressed, skip to song position based on x pos clicked.
         """
-        x_pos = np.max(int(mouse_event.scenePos()[0]), 0)
+        x_pos = max(int(mouse_event.scenePos()[0]), 0)
         button = mouse_event.button()
         mods = mouse_event.modifiers()
 
@@ -205,22 +227,30 @@ class PlaybackControls(QObject):
         marker. When both markers have values set, song looping
         logic is actuated.
         """
+        # Apply all marker, overlay and style changes in one repaint
+        self.widgets["waveform"].setUpdatesEnabled(False)
+        try:
+            self.move_loop_markers(x_pos, button)
+        finally:
+            self.widgets["waveform"].setUpdatesEnabled(True)
+
+    def move_loop_markers(self, x_pos: int, button) -> None:
+        """
+        Moves the left or right loop marker to a clicked x position,
+        inverting the markers if they would cross over.
+        """
         left_marker = self.audio.loop_markers[0]
         right_marker = self.audio.loop_markers[1]
 
-        marker_pos = round(( # Marker time position in frames
-            (x_pos/self.widgets["waveform"].width)
-            * self.audio.song.duration
-            * self.audio_config["rate"]
-        ))
-        time_constraint = 1 * self.audio_config["rate"] # Minimum loop time of 1 sec
+        marker_pos = round(x_pos * self._px_to_frames) # Marker time position in frames
+        time_constraint = 1 * self._rate # Minimum loop time of 1 sec
 
         # Update left marker when left mouse pressed
         if button == Qt.MouseButton.LeftButton:
             if right_marker is None:
                 left_marker = marker_pos
                 self.widgets["left_marker_img"].move(x_pos-9, 2)
-            elif np.abs(right_marker - marker_pos) >= time_constraint:
+            elif abs(right_marker - marker_pos) >= time_constraint:
                 # Invert markers if new left marker > right marker
                 if marker_pos > right_marker:
                     left_marker = right_marker
@@ -241,7 +271,7 @@ class PlaybackControls(QObject):
             if left_marker is None:
                 right_marker = marker_pos
                 self.widgets["right_marker_img"].move(x_pos-9, 2)
-            elif np.abs(marker_pos - left_marker) >= time_constraint:
+            elif abs(marker_pos - left_marker) >= time_constraint:
                 # Invert markers if new right marker < left marker
                 if marker_pos < left_marker:
                     right_marker = left_marker
@@ -258,11 +288,9 @@ class PlaybackControls(QObject):
             self.widgets["right_marker_img"].show() # Show marker when set
 
         # Update playback loop markers (in frames)
-        self.audio.loop_markers[0] = left_marker
-        self.audio.loop_markers[1] = right_marker
+        self.audio.set_loop_markers(left_marker, right_marker)
 
-        if (not None in (self.audio.loop_markers[0], self.audio.loop_markers[1])
-            and not self.audio.looping):
+        if not None in self.audio.loop_markers and not self.audio.looping:
             # Looping set to true when both markers set
             self.audio.looping = True
 
@@ -272,9 +300,7 @@ class PlaybackControls(QObject):
         overlay.
         """
         # Set active styles for loop markers and button
-        self.widgets["left_marker_img"].setStyleSheet(self.styles["active_marker"])
-        self.widgets["right_marker_img"].setStyleSheet(self.styles["active_marker"])
-        self.widgets["loop_button"].setStyleSheet(self.styles["active_loop_button"])
+        self.set_loop_styles(True)
 
         # Show the loop overlay widget when its area has been created by
         # the left and right markers
@@ -282,7 +308,7 @@ class PlaybackControls(QObject):
         right_x = self.widgets["right_marker_img"].x() + 9
         self.widgets["loop_overlay"].move(left_x, 2)
         self.widgets["loop_overlay"].resize(
-            np.abs(right_x - left_x), self.widgets["waveform"].height - 3
+            abs(right_x - left_x), self.widgets["waveform"].height - 3
         )
         self.widgets["loop_overlay"].show()
 
@@ -291,18 +317,14 @@ class PlaybackControls(QObject):
         Skips to song position based on x position of left-click
         on waveform plot.
         """
-        self.widgets["playhead"].move(x_pos, 2) # Update playhead x position
+        self._move_playhead(x_pos, 2) # Update playhead x position
 
-        song_pos = (x_pos/self.widgets["waveform"].width) * self.audio.song.duration
+        song_pos = x_pos * self._px_to_sec
         self.audio.seek(song_pos) # Update song time position
         self.reset_score_signal.emit() # Send signal to GUI to reset score
 
-        self.widgets["duration_label"].setText( # Update song time display
-            f"<font color='{self.gui_config['theme_colour']}'>{time_format(song_pos)}</font>"
-            f" / {time_format(self.audio.song.duration)}"
-        )
-
-        print(f"\nSong skipped to: {time_format(song_pos)}") # Testing
+        self._set_duration_text(time_format(song_pos)) # Update song time display
+        self._last_cs = -1
 
         # Case: song count-in is disabled
         if not self.audio.metronome["count_in_enabled"]:
@@ -27,10 +27,17 @@ class PracticeWindow(QWidget):
         super().__init__()
 
         self.gui_config = read_config("GUI")
+        # Score label templates filled on each score update
+        self._score_fmt = f"Score <font color='{self.gui_config['theme_colour']}'>{{}}</font>"
+        self._accuracy_fmt = (
+            f"Accuracy <font color='{self.gui_config['theme_colour']}'>{{:.1f}}%    </font>"
+        )
 
         self.audio = audio
         self.scorer = scorer
         self.perf_time_start = None
+        self._pending_score = None # Latest score data not yet displayed
+        self._shown_labels = None # Score label texts currently displayed
 
         self.widgets = self.set_components()
 
@@ -42,6 +49,10 @@ class PracticeWindow(QWidget):
 
     def set_components(self) -> dict[str]:
         """Initialises all widgets and adds them to the window."""
+        # Window dimensions that widget sizes are scaled from
+        min_width = self.gui_config["min_width"]
+        min_height = self.gui_config["min_height"]
+
         # Song Information Labels
 
         song_info_layout = QHBoxLayout()
@@ -53,7 +64,7 @@ class PracticeWindow(QWidget):
         # Column 1
 
         prev_accuracy_label = QLabel()
-        prev_accuracy_label.setFixedWidth(int(self.gui_config["min_width"]*0.2))
+        prev_accuracy_label.setFixedWidth(int(min_width*0.2))
         prev_accuracy_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         prev_accuracy_label.setText(
             f"Prev. Accuracy <font color='{self.gui_config['theme_colour']}'>N/A</font>"
@@ -84,12 +95,12 @@ class PracticeWindow(QWidget):
             swing_label,
             alignment=Qt.AlignmentFlag.AlignCenter
         )
-        song_info_col1.addSpacing(int(self.gui_config["min_height"]*0.05))
+        song_info_col1.addSpacing(int(min_height*0.05))
 
         # Column 2
 
         accuracy_label = QLabel()
-        accuracy_label.setFixedWidth(int(self.gui_config["min_width"]*0.3))
+        accuracy_label.setFixedWidth(int(min_width*0.3))
         accuracy_label.setObjectName("accuracy_label")
         accuracy_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         accuracy_label.setText(
@@ -103,13 +114,24 @@ class PracticeWindow(QWidget):
             f"Score <font color='{self.gui_config['theme_colour']}'>0</font>"
         )
 
+        # Current time and total duration are separate plain text labels
+        # so song position updates need no rich text parsing
         duration_label = QLabel()
         duration_label.setObjectName("duration_label")
-        duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        duration_label.setText(
-            f"<font color='{self.gui_config['theme_colour']}'>00:00.00</font>"
-            f" / {time_format(self.audio.song.duration)}"
-        )
+        duration_label.setTextFormat(Qt.TextFormat.PlainText)
+        duration_label.setStyleSheet(f"color: {self.gui_config['theme_colour']};")
+        duration_label.setText("00:00.00")
+
+        total_duration_label = QLabel()
+        total_duration_label.setObjectName("total_duration_label")
+        total_duration_label.setTextFormat(Qt.TextFormat.PlainText)
+        total_duration_label.setText(f" / {time_format(self.audio.song.duration)}")
+
+        duration_layout = QHBoxLayout()
+        duration_layout.setSpacing(0)
+        duration_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        duration_layout.addWidget(duration_label)
+        duration_layout.addWidget(total_duration_label)
 
         # Layout
 
@@ -123,16 +145,13 @@ class PracticeWindow(QWidget):
             alignment=Qt.AlignmentFlag.AlignCenter
         )
         song_info_col2.addStretch()
-        song_info_col2.addWidget(
-            duration_label,
-            alignment=Qt.AlignmentFlag.AlignCenter
-        )
-        song_info_col2.addSpacing(int(self.gui_config["min_height"]*0.05))
+        song_info_col2.addLayout(duration_layout)
+        song_info_col2.addSpacing(int(min_height*0.05))
 
         # Column 3
 
         gamemode_label = QLabel()
-        gamemode_label.setFixedWidth(int(self.gui_config["min_width"]*0.25))
+        gamemode_label.setFixedWidth(int(min_width*0.25))
         gamemode_label.setObjectName("gamemode_label")
         gamemode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         gamemode_label.setText("Practice Mode")
@@ -165,7 +184,7 @@ class PracticeWindow(QWidget):
             title_label,
             alignment=Qt.AlignmentFlag.AlignCenter
         )
-        song_info_col3.addSpacing(int(self.gui_config["min_height"]*0.05))
+        song_info_col3.addSpacing(int(min_height*0.05))
 
         # Column 4
 
@@ -173,12 +192,12 @@ class PracticeWindow(QWidget):
         back_button.setObjectName("back_button")
         back_button.setToolTip("Back to song select menu")
         back_button.setFixedSize(
-            int(self.gui_config["min_width"]*0.022),
-            int(self.gui_config["min_width"]*0.022)
+            int(min_width*0.022),
+            int(min_width*0.022)
         )
 
         col4_positioner_element = QWidget()
-        col4_positioner_element.setFixedSize(int(self.gui_config["min_width"]*0.05), 0)
+        col4_positioner_element.setFixedSize(int(min_width*0.05), 0)
 
         # Layout
 
@@ -194,7 +213,7 @@ class PracticeWindow(QWidget):
 
         # All Columns Layout
 
-        song_info_layout.addSpacing(int(self.gui_config["min_width"]*0.15))
+        song_info_layout.addSpacing(int(min_width*0.15))
         song_info_layout.addLayout(song_info_col1)
         song_info_layout.addStretch()
         song_info_layout.addLayout(song_info_col2)
@@ -202,13 +221,13 @@ class PracticeWindow(QWidget):
         song_info_layout.addLayout(song_info_col3)
         song_info_layout.addStretch()
         song_info_layout.addLayout(song_info_col4)
-        song_info_layout.addSpacing(int(self.gui_config["min_width"]*0.05))
+        song_info_layout.addSpacing(int(min_width*0.05))
 
         # Waveform Plot
 
         waveform = WaveformPlot(
-            width=int(self.gui_config["min_width"]*0.9),
-            height=int(self.gui_config["min_height"]*0.2),
+            width=int(min_width*0.9),
+            height=int(min_height*0.2),
             colour=hex_to_rgb(self.gui_config["theme_colour"])
         )
         waveform.setObjectName("waveform")
@@ -238,8 +257,8 @@ class PracticeWindow(QWidget):
             Qt.WidgetAttribute.WA_TransparentForMouseEvents, True
         )
         left_marker_img.resize(
-            int(self.gui_config["min_width"]*0.017),
-            int(self.gui_config["min_width"]*0.017)
+            int(min_width*0.017),
+            int(min_width*0.017)
         )
         left_marker_img.hide()
 
@@ -250,14 +269,15 @@ class PracticeWindow(QWidget):
             Qt.WidgetAttribute.WA_TransparentForMouseEvents, True
         )
         right_marker_img.resize(
-            int(self.gui_config["min_width"]*0.017),
-            int(self.gui_config["min_width"]*0.017)
+            int(min_width*0.017),
+            int(min_width*0.017)
         )
         right_marker_img.hide()
 
-        # Song time position timer
+        # GUI update timer (song time position and score labels)
         audiopos_timer = QTimer()
-        audiopos_timer.setInterval(10)
+        audiopos_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        audiopos_timer.setInterval(16) # ~60 updates per second
 
         # Audio Playback Controls
 
@@ -270,15 +290,15 @@ class PracticeWindow(QWidget):
         volume_image = QWidget()
         volume_image.setObjectName("volume_image")
         volume_image.setFixedSize(
-            int(self.gui_config["min_width"]*0.017),
-            int(self.gui_config["min_width"]*0.017)
+            int(min_width*0.017),
+            int(min_width*0.017)
         )
 
         # Guitar volume slider
         guitar_vol_slider = QSlider(orientation=Qt.Orientation.Horizontal)
         guitar_vol_slider.setObjectName("guitar_vol_slider")
         guitar_vol_slider.setToolTip("Change guitar track volume in mix.")
-        guitar_vol_slider.setFixedWidth(int(self.gui_config["min_width"]*0.278))
+        guitar_vol_slider.setFixedWidth(int(min_width*0.278))
         guitar_vol_slider.setRange(0, 100)
         guitar_vol_slider.setPageStep(5)
         guitar_vol_slider.setSliderPosition(100)
@@ -289,52 +309,36 @@ class PracticeWindow(QWidget):
         guitar_vol_val_label.setText("100%")
 
         # Buttons
-        button_width = int(self.gui_config["min_width"]*0.05)
-        button_height = int(self.gui_config["min_height"]*0.11)
-
-        # Count-in toggle button
-        count_in_button = QPushButton()
-        count_in_button.setObjectName("count_in_button")
-        count_in_button.setToolTip("Toggle metronome count-in.")
-        count_in_button.setFixedSize(button_width, button_height)
+        button_width = int(min_width*0.05)
+        button_height = int(min_height*0.11)
+
+        # Playback control buttons: (name, tooltip, grid column, alignment)
+        button_specs = (
+            ("count_in_button", "Toggle metronome count-in.", 0,
+             Qt.AlignmentFlag.AlignRight),
+            ("skip_back_button", "Skip back 5 seconds.", 1, Qt.AlignmentFlag(0)),
+            ("play_button", "Start or resume song playback.", 2, Qt.AlignmentFlag(0)),
+            ("pause_button", "Pause song playback.", 2, Qt.AlignmentFlag(0)),
+            ("skip_forward_button", "Skip forward 5 seconds.", 3, Qt.AlignmentFlag(0)),
+            ("loop_button",
+             "Toggle section looping.<br><br> \
+             <b>shift+mouse1</b> sets the left loop marker.<br> \
+             <b>shift+mouse2</b> sets the right loop marker.",
+             4, Qt.AlignmentFlag.AlignLeft)
+        )
+        buttons = {}
+        for name, tooltip, _, _ in button_specs:
+            button = QPushButton()
+            button.setObjectName(name)
+            button.setToolTip(tooltip)
+            button.setFixedSize(button_width, button_height)
+            buttons[name] = button
+        buttons["pause_button"].hide() # Play button shown until playback starts
 
         # Song count-in timer
         count_in_timer = QTimer()
-
-        # Skip back button
-        skip_back_button = QPushButton()
-        skip_back_button.setObjectName("skip_back_button")
-        skip_back_button.setToolTip("Skip back 5 seconds.")
-        skip_back_button.setFixedSize(button_width, button_height)
-
-        # Play button
-        play_button = QPushButton()
-        play_button.setObjectName("play_button")
-        play_button.setToolTip("Start or resume song playback.")
-        play_button.setFixedSize(button_width, button_height)
-
-        # Pause button
-        pause_button = QPushButton()
-        pause_button.setObjectName("pause_button")
-        pause_button.setToolTip("Pause song playback.")
-        pause_button.hide()
-        pause_button.setFixedSize(button_width, button_height)
-
-        # Skip forward button
-        skip_forward_button = QPushButton()
-        skip_forward_button.setObjectName("skip_forward_button")
-        skip_forward_button.setToolTip("Skip forward 5 seconds.")
-        skip_forward_button.setFixedSize(button_width, button_height)
-
-        # Loop toggle button
-        loop_button = QPushButton()
-        loop_button.setObjectName("loop_button")
-        loop_button.setToolTip(
-            "Toggle section looping.<br><br> \
-            <b>shift+mouse1</b> sets the left loop marker.<br> \
-            <b>shift+mouse2</b> sets the right loop marker."
-        )
-        loop_button.setFixedSize(button_width, button_height)
+        # Ticks trigger audible metronome clicks, so avoid coarse timer drift
+        count_in_timer.setTimerType(Qt.TimerType.PreciseTimer)
 
         # Layouts
         controls_layout = QVBoxLayout()
@@ -360,46 +364,21 @@ class PracticeWindow(QWidget):
             alignment=Qt.AlignmentFlag.AlignLeft
         )
 
-        controls_layout_top_row.addSpacing(int(self.gui_config["min_width"]*0.021))
+        controls_layout_top_row.addSpacing(int(min_width*0.021))
 
         # Bottom row
 
-        controls_layout_bottom_row.addWidget( # Count-in button
-            count_in_button,
-            0, 0,
-            alignment=Qt.AlignmentFlag.AlignRight
-        )
-
-        controls_layout_bottom_row.addWidget( # Skip back button
-            skip_back_button,
-            0, 1
-        )
-
-        controls_layout_bottom_row.addWidget( # Play button
-            play_button,
-            0, 2
-        )
-
-        controls_layout_bottom_row.addWidget( # Pause button
-            pause_button,
-            0, 2
-        )
-
-        controls_layout_bottom_row.addWidget( # Skip forward button
-            skip_forward_button,
-            0, 3
-        )
-
-        controls_layout_bottom_row.addWidget( # Loop button
-            loop_button,
-            0, 4,
-            alignment=Qt.AlignmentFlag.AlignLeft
-        )
+        for name, _, column, alignment in button_specs: # Playback buttons
+            controls_layout_bottom_row.addWidget(
+                buttons[name],
+                0, column,
+                alignment=alignment
+            )
 
         controls_layout_bottom_row.setHorizontalSpacing(0)
         controls_layout_bottom_row.setContentsMargins(
-            int(self.gui_config["min_width"]*0.05), int(self.gui_config["min_height"]*0.05),
-            int(self.gui_config["min_width"]*0.05), int(self.gui_config["min_height"]*0.05)
+            int(min_width*0.05), int(min_height*0.05),
+            int(min_width*0.05), int(min_height*0.05)
         )
 
         controls_layout.addLayout(controls_layout_top_row)
@@ -408,13 +387,13 @@ class PracticeWindow(QWidget):
         # Main Layout
 
         layout = QVBoxLayout()
-        layout.addSpacing(int(self.gui_config["min_height"]*0.05))
+        layout.addSpacing(int(min_height*0.05))
         layout.addLayout(song_info_layout)
         layout.addWidget(
             waveform,
             alignment=Qt.AlignmentFlag.AlignCenter
         )
-        layout.addSpacing(int(self.gui_config["min_height"]*0.05))
+        layout.addSpacing(int(min_height*0.05))
         layout.addLayout(controls_layout)
         self.setLayout(layout)
 
@@ -424,7 +403,8 @@ class PracticeWindow(QWidget):
             "swing_label": swing_label,
             "artist_label": artist_label, 
             "title_label": title_label,
-            "duration_label": duration_label, 
+            "duration_label": duration_label,
+            "total_duration_label": total_duration_label,
             "score_label": score_label,
             "accuracy_label": accuracy_label,
             "gamemode_label": gamemode_label,
@@ -438,13 +418,8 @@ class PracticeWindow(QWidget):
             "guitar_vol_label": guitar_vol_label, 
             "guitar_vol_slider": guitar_vol_slider,
             "guitar_vol_val_label": guitar_vol_val_label, 
-            "count_in_button": count_in_button,
-            "count_in_timer": count_in_timer, 
-            "skip_back_button": skip_back_button,
-            "play_button": play_button, 
-            "pause_button": pause_button,
-            "skip_forward_button": skip_forward_button, 
-            "loop_button": loop_button
+            "count_in_timer": count_in_timer,
+            **buttons
         }
 
     def set_styles(self) -> dict[str, str]:
@@ -491,11 +466,16 @@ class PracticeWindow(QWidget):
         Sets the connections between QObjects and their connected
         functions.
         """
+        # Signals emitted from worker threads are explicitly queued onto
+        # the GUI thread. All other signals are emitted from the GUI
+        # thread, so AutoConnection already calls their slots directly.
         self.audio.new_input_buffer_signal.connect(
-            self.receive_new_input_audio
+            self.receive_new_input_audio,
+            type=Qt.ConnectionType.QueuedConnection
         )
         self.scorer.new_score_data_signal.connect(
-            self.receive_new_score_data
+            self.receive_new_score_data,
+            type=Qt.ConnectionType.QueuedConnection
         )
         self.controls.reset_score_signal.connect(
             self.receive_reset_score_signal
@@ -507,7 +487,7 @@ class PracticeWindow(QWidget):
             self.controls.waveform_pressed
         )
         self.widgets["audiopos_timer"].timeout.connect(
-            self.controls.update_song_pos
+            self.update_tick
         )
         self.widgets["guitar_vol_slider"].valueChanged.connect(
             self.controls.guitar_vol_slider_moved
@@ -541,12 +521,8 @@ class PracticeWindow(QWidget):
         manually changed.
         """
         # Set accuracy and score labels to zero
-        self.widgets["accuracy_label"].setText(
-            f"Accuracy <font color='{self.gui_config['theme_colour']}'>0.0%    </font>"
-        )
-        self.widgets["score_label"].setText(
-            f"Score <font color='{self.gui_config['theme_colour']}'>0</font>"
-        )
+        self.widgets["accuracy_label"].setText(self._accuracy_fmt.format(0))
+        self.widgets["score_label"].setText(self._score_fmt.format(0))
         # Set prev. labels to current vals before resetting
         if self.scorer.score > 0:
             self.widgets["prev_accuracy_label"].setText(
@@ -558,6 +534,8 @@ class PracticeWindow(QWidget):
                 + f"{self.scorer.score}</font>")
             )
         self.widgets["swing_label"].setText("")
+        self._pending_score = None # Discard score data from before reset
+        self._shown_labels = None
         self.scorer.zero_score_data()
 
     def receive_new_input_audio(
@@ -575,18 +553,28 @@ class PracticeWindow(QWidget):
         self,
         data: tuple[int, float, float]
     ) -> None:
-        """Update GUI score information with new score data."""
-        score, accuracy, swing = data
-
+        """
+        Store new score data to be shown on the next GUI update tick,
+        or show it immediately if playback is paused.
+        """
         perf_time_end = time.perf_counter()
         print(f"\033[92mElapsed scoring time: {perf_time_end-self.perf_time_start}\033[0m")
 
-        self.widgets["score_label"].setText(
-            f"Score <font color='{self.gui_config['theme_colour']}'>{score}</font>"
-        )
-        self.widgets["accuracy_label"].setText(
-            f"Accuracy <font color='{self.gui_config['theme_colour']}'>{accuracy:.1f}%    </font>"
-        )
+        self._pending_score = data
+        if not self.widgets["audiopos_timer"].isActive():
+            self.update_score_labels()
+
+    def update_tick(self) -> None:
+        """Apply all periodic GUI updates every 16ms during playback."""
+        self.controls.update_song_pos()
+        self.update_score_labels()
+
+    def update_score_labels(self) -> None:
+        """Update GUI score information with pending score data."""
+        if self._pending_score is None:
+            return
+        score, accuracy, swing = self._pending_score
+        self._pending_score = None
 
         swing *= 1000 # In ms
         swing_label_text = ""
@@ -597,5 +585,18 @@ class PracticeWindow(QWidget):
             swing_label_text = f"Rushing by <font color='#ff0000'>~{round(-swing)}ms</font>"
         else:
             swing_label_text = f"Dragging by <font color='#ff0000'>~{round(swing)}ms</font>"
-        self.widgets["swing_label"].setText(swing_label_text)
+
+        # Only set label texts that differ from those displayed
+        labels = (
+            self._score_fmt.format(score),
+            self._accuracy_fmt.format(accuracy),
+            swing_label_text
+        )
+        shown = self._shown_labels or (None, None, None)
+        for name, text, shown_text in zip(
+            ("score_label", "accuracy_label", "swing_label"), labels, shown
+        ):
+            if text != shown_text:
+                self.widgets[name].setText(text)
+        self._shown_labels = labels
         self.widgets["swing_label"].show()
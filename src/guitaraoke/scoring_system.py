@@ -13,25 +13,22 @@ Functions
 compare_notes
     Take two note dictionaries (user and song) and return user scores.
 
-unique_nearest_notes
-    Get all unique nearest song-user note pairs (used in 
-    compare_notes).
-
 process_recording
     Compare the user input recording's notes against the song's,
     returning the resultant score data.
 """
 
 import os
-from collections import deque, defaultdict
+from collections import deque
 import tempfile
 import concurrent.futures
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal # pylint: disable=no-name-in-module
 from scipy.io.wavfile import write as write_wav
+from scipy.optimize import linear_sum_assignment
 from guitaraoke.save_notes import save_notes
 from guitaraoke.utils import (
-    preprocess_note_data, csv_to_notes_dataframe, read_config
+    preprocess_note_data, csv_to_notes_arrays, read_config
 )
 
 config = read_config("Audio")
@@ -195,6 +192,7 @@ def compare_notes(
     total_notes = 0
     notes_hit = 0
     note_swing_times = []
+    hit_window = config["note_hit_window"]
 
     # Iterate over user and song note events for all 128 MIDI pitches
     for pitch in range(128):
@@ -210,96 +208,39 @@ def compare_notes(
         if len(user_note_times) == 0:
             continue
 
-        # nearest_times is a 2D array whose first dimension indexes correspond
-        # to the song_note_times array, and its second dimension contains a
-        # given song note time's sorted distances from all user note times.
-        nearest_notes = []
-        for note_time in song_note_times: # O(n*m*log(m))
-            # Get a list of user time indexes sorted by distance from song time
-            sorted_dist_idxs = np.argsort(
-                np.abs(np.array(user_note_times) - note_time)
-            )
-            # Add user note times in sorted order to nearest_times 2D array
-            nearest_notes.append(
-                [user_note_times[d] for d in sorted_dist_idxs]
-            )
-
-        # Match all nearest unique pairs of user and song notes
-        nearest_notes = unique_nearest_notes( # O(n^2*m)
-            nearest_notes,
-            song_note_times
-        )
-
-        for i, notes in enumerate(nearest_notes):
-            # Song notes with no unique nearest user note are skipped
-            # and automatically considered a miss
-            if not notes:
-                continue
+        song_times = np.asarray(song_note_times)
+        user_times = np.asarray(user_note_times)
 
-            # Absolute distance from note for scoring
-            dist = np.abs(notes[0] - song_note_times[i])
+        # Distances between every song note (rows) and user note (cols)
+        distances = np.abs(song_times[:, None] - user_times[None, :])
 
-            # Perform scoring logic
-
-            # Tolerance to account for swing and variance in preds
-            if dist <= config["note_hit_window"]:
-                notes_hit += 1
-            elif dist <= config["note_hit_window"] * 2:
-                # Deduct from note score for inaccurate timing
-                notes_hit += 1 - config["close_hit_penalty"]
-            else: # If note time outside of tolerance window
-                continue
+        # Match unique song-user note pairs with the lowest total
+        # distance. Distances past the scoring window are capped so
+        # far-off notes can't outweigh pairs that score
+        song_idxs, user_idxs = linear_sum_assignment(
+            np.minimum(distances, hit_window * 3)
+        )
 
-            # Positive means dragging, negative means rushing
-            swing_amt = notes[0] - song_note_times[i]
-            note_swing_times.append(swing_amt)
+        # Song notes with no matched user note are automatically
+        # considered a miss
+        dists = distances[song_idxs, user_idxs]
+
+        # Tolerance to account for swing and variance in preds, with a
+        # deduction from note score for inaccurate timing
+        notes_hit += float(np.where(
+            dists <= hit_window, 1,
+            np.where(dists <= hit_window * 2, 1 - config["close_hit_penalty"], 0)
+        ).sum())
+
+        # Positive means dragging, negative means rushing (only for
+        # notes inside the tolerance window)
+        note_swing_times.extend(
+            (user_times[user_idxs] - song_times[song_idxs])[dists <= hit_window * 2].tolist()
+        )
 
     return notes_hit*100, notes_hit, total_notes, note_swing_times
 
 
-def unique_nearest_notes(
-    nearest_notes: list,
-    song_notes: list
-) -> list:
-    """
-    Get all unique nearest song note - user note pairs by iterating
-    over song notes' nearest user note times and checking for 
-    duplicates.
-    """
-    unique_pairs = False
-    while not unique_pairs:
-        for i in range(len(nearest_notes)-1):
-            for j in range(i+1, len(nearest_notes)):
-                # First song note has been removed
-                if not nearest_notes[i]:
-                    break
-                # Second song note removed or nearest user notes are dissimilar
-                if (not nearest_notes[j]
-                    or nearest_notes[i][0] != nearest_notes[j][0]):
-                    continue
-
-                i_dist = np.abs(song_notes[i] - nearest_notes[i][0])
-                j_dist = np.abs(song_notes[j] - nearest_notes[j][0])
-
-                # The song note time with the larger distance has the user
-                # note time deleted from its corresponding array, updating
-                # index 0 to the next closest user note time.
-                if i_dist > j_dist:
-                    del nearest_notes[i][0]
-                else:
-                    del nearest_notes[j][0]
-
-        # Check for duplicates
-        freq = defaultdict(int)
-        for t in nearest_notes:
-            if t:
-                freq[t[0]] += 1
-
-        # End loop if no song notes are sharing the same nearest user note
-        if not [t for t in freq if freq[t] > 1]:
-            unique_pairs = True
-    return nearest_notes
-
 def process_recording(
     buffer: np.ndarray,
     position: int,
@@ -330,8 +271,8 @@ def process_recording(
     score_data = (0,0,0,[])
     try:
         # Align user note event times to song position
-        user_notes = csv_to_notes_dataframe(user_notes_path)
-        user_notes["start_time_s"] += (
+        user_notes = csv_to_notes_arrays(user_notes_path)
+        user_notes["start"] += (
             (position/config["rate"]) - (time_offset/config["rate"])
         )
 
@@ -2,13 +2,15 @@
 
 import os
 import csv
-from configparser import ConfigParser
+from pathlib import Path
 from PyQt6.QtCore import Qt, pyqtSignal # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import ( # pylint: disable=no-name-in-module
     QWidget, QDialog, QDialogButtonBox, QVBoxLayout, QPushButton, QLabel,
     QFileDialog, QComboBox, QFormLayout, QLineEdit, QGroupBox, QHBoxLayout
 )
-from guitaraoke.utils import read_config, find_audio_devices
+from guitaraoke.utils import (
+    read_config, write_config, find_audio_devices, read_stylesheet
+)
 
 
 class PopupWindow(QDialog):
@@ -63,12 +65,8 @@ class PopupWindow(QDialog):
 
     def set_styles(self) -> None:
         """Sets the CSS styling of the window and widgets."""
-        with open(
-            f"{os.environ['assets_dir']}\\stylesheets\\main.qss", "r", encoding="utf-8"
-        ) as f:
-            # Read main stylesheet and set main window style
-            _style = f.read()
-            self.setStyleSheet(_style)
+        # Set main window style from the main stylesheet
+        self.setStyleSheet(read_stylesheet("main"))
 
     def form_accepted(self) -> None:
         """Send new title and artist to the setup window."""
@@ -213,7 +211,7 @@ class SetupWindow(QWidget):
 
         title, artist = None, None
         self.song_filepath = file_path
-        with open("data\\saved_songs.csv", "r", encoding="utf-8") as data:
+        with open(Path("data") / "saved_songs.csv", "r", encoding="utf-8") as data:
             for song in csv.DictReader(data):
                 if song["path"] == self.song_filepath:
                     title, artist = song["title"], song["artist"]
@@ -241,7 +239,7 @@ class SetupWindow(QWidget):
         window to the saved_songs CSV file.
         """
         title, artist = data
-        with open("data\\saved_songs.csv", "a", encoding="utf-8") as file:
+        with open(Path("data") / "saved_songs.csv", "a", encoding="utf-8") as file:
             writer = csv.DictWriter(file, fieldnames=["path", "title", "artist"])
             writer.writerow(
                 {"path": self.song_filepath, "title": title, "artist": artist}
@@ -258,11 +256,6 @@ class SetupWindow(QWidget):
 
     def set_input_device(self, idx: int) -> None:
         """Update config file with new input device index."""
-        parser = ConfigParser()
-        parser.read("data\\config.ini")
-        parser.set("Audio", "input_device_index", str(idx))
-
-        with open("data\\config.ini", "w+", encoding="utf-8") as configfile:
-            parser.write(configfile)
+        write_config("Audio", {"input_device_index": idx})
 
         print("Input device index changed to:", idx)
@@ -6,8 +6,24 @@ Functions
 read_config(section)
     Get Audio or GUI variables from the config file.
 
+write_config(section, values)
+    Set variables in the config file.
+
 find_audio_devices()
-    Get lists of user audio input and output devices.
+    Get cached user audio input and output devices.
+
+read_stylesheet(name)
+    Get the cached contents of a Qt stylesheet asset.
+
+load_wav(path, rate)
+    Return a WAV file's audio time series as a float32 array.
+
+load_wav_mmap(path, rate)
+    Return a WAV file's audio time series memory-mapped from a saved
+    .npy file.
+
+file_hash(path)
+    Return a short hash identifying a file's contents.
 
 time_format(time)
     Return a time in MM:SS.CC format.
@@ -15,38 +31,65 @@ time_format(time)
 hex_to_rgb(hex_string)
     Get an RGB equivalent from a hex triplet.
 
-csv_to_notes_dataframe(path)
-    Return sorted Pandas DataFrame converted from a notes CSV file.
+csv_to_notes_arrays(path)
+    Return sorted note event arrays converted from a notes CSV file.
 
 preprocess_note_data(
     notes, 
     slice_start=None, slice_end=None, 
     offset_latency=False
 )
-    Return a dict of note events for 128 pitches from a notes 
-    Dataframe.
+    Return a dict of note events for 128 pitches from note event
+    arrays.
 """
 
+import os
 import math
+import functools
+import hashlib
 from pathlib import Path
 from configparser import ConfigParser
+import librosa
+import numpy as np
 import pandas as pd
 import sounddevice as sd
+import soundfile as sf
 
+CONFIG_PATH = Path("data") / "config.ini"
 
 def read_config(section: str) -> dict[str]:
-    """Get Audio or GUI config variables."""
+    """
+    Get Audio or GUI config variables. Parsed values are cached until
+    the config file is modified.
+    """
     if section not in ("Audio", "GUI"):
         raise ValueError("Only config sections are: Audio, GUI")
 
+    try:
+        config_stat = CONFIG_PATH.stat()
+        file_version = (config_stat.st_mtime_ns, config_stat.st_size)
+    except FileNotFoundError:
+        file_version = None
+    return dict(_parse_config(section, file_version))
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(section: str, file_version: tuple | None) -> dict[str]: # pylint: disable=unused-argument
+    """
+    Parse a config file section's variables (cached per version of the
+    config file).
+    """
     parser = ConfigParser()
-    parser.read("data\\config.ini")
+    parser.read(CONFIG_PATH)
 
     if section == "Audio":
         config_vals = {
             "channels": parser.getint(section, "channels"),
             "rate": parser.getint(section, "rate"),
             "dtype": parser.get(section, "dtype"),
+            "blocksize": parser.getint(section, "blocksize"),
+            "max_blocksize": parser.getint(section, "max_blocksize"),
+            "underrun_limit": parser.getint(section, "underrun_limit"),
+            "latency": parser.getfloat(section, "latency"),
             "rec_buffer_size": parser.getint(section, "rec_buffer_size"),
             "rec_overlap_window_size": parser.getint(section, "rec_overlap_window_size"),
             "input_device_index": parser.getint(section, "input_device_index"),
@@ -64,8 +107,23 @@ def read_config(section: str) -> dict[str]:
         }
     return config_vals
 
-def find_audio_devices() -> tuple[list, list]:
-    """Return two lists of user audio input and output devices."""
+def write_config(section: str, values: dict[str]) -> None:
+    """Set config variables in a section and save the config file."""
+    parser = ConfigParser()
+    parser.read(CONFIG_PATH)
+    for key, value in values.items():
+        parser.set(section, key, str(value))
+
+    with open(CONFIG_PATH, "w", encoding="utf-8") as configfile:
+        parser.write(configfile)
+
+@functools.cache
+def find_audio_devices() -> tuple[tuple, tuple]:
+    """
+    Return two tuples of user audio input and output devices. The
+    result is cached, as PortAudio's device list is fixed once it is
+    initialised (call find_audio_devices.cache_clear() to re-query).
+    """
     devices = sd.query_devices()
     input_devs = []
     output_devs = []
@@ -75,7 +133,56 @@ def find_audio_devices() -> tuple[list, list]:
                 input_devs.append(d)
             if d["max_output_channels"] > 0:
                 output_devs.append(d)
-    return input_devs, output_devs
+    return tuple(input_devs), tuple(output_devs)
+
+@functools.cache
+def read_stylesheet(name: str) -> str:
+    """
+    Return the contents of a .qss file in the stylesheets assets
+    directory. The result is cached, as assets do not change while
+    the application is running.
+    """
+    path = Path(os.environ["assets_dir"]) / "stylesheets" / f"{name}.qss"
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def load_wav(path: str | Path, rate: int) -> np.ndarray:
+    """
+    Return a WAV file's audio time series at a given sample rate as a
+    C-contiguous float32 array, so slices copied into stream buffers
+    need no dtype conversion.
+    """
+    data, file_rate = sf.read(path, dtype="float32", always_2d=False)
+    if data.ndim == 2: # Mix down to mono
+        data = data.mean(axis=1, dtype=np.float32)
+    # Only resample if the file is not already at the given rate
+    if file_rate != rate:
+        data = librosa.resample(data, orig_sr=file_rate, target_sr=rate)
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    assert data.dtype == np.float32 and data.flags["C_CONTIGUOUS"]
+    return data
+
+def load_wav_mmap(path: str | Path, rate: int) -> np.ndarray:
+    """
+    Return a WAV file's audio time series memory-mapped from a .npy
+    file saved next to it, decoding and saving it on first load so the
+    OS only pages in the parts of the track that are played.
+    """
+    npy_path = Path(path).with_suffix(".npy")
+    if not npy_path.exists():
+        np.save(npy_path, load_wav(path, rate))
+    return np.load(npy_path, mmap_mode="r")
+
+def file_hash(path: str | Path) -> str:
+    """
+    Return a short BLAKE2b hex digest of a file's size and first
+    megabyte, enough to tell audio files apart without reading them
+    in full.
+    """
+    digest = hashlib.blake2b(str(Path(path).stat().st_size).encode(), digest_size=8)
+    with open(path, "rb") as f:
+        digest.update(f.read(1 << 20))
+    return digest.hexdigest()
 
 def time_format(time: float) -> str:
     """Take a time in seconds and return it in MM:SS.CC format."""
@@ -91,34 +198,38 @@ def hex_to_rgb(hex_string: str) -> tuple:
     return tuple(int(hex_string.lstrip("#")[i:i+2], 16) for i in (0, 2, 4))
 
 
-def csv_to_notes_dataframe(path: Path) -> pd.DataFrame:
+def csv_to_notes_arrays(path: Path) -> dict[str, np.ndarray]:
     """
-    Return a Pandas DataFrame from a notes CSV file, dropping
-    unnecessary columns and sorting by note onset times.
+    Return a notes CSV file's note events as a struct of parallel
+    arrays (start, end, pitch), sorted by note onset times.
     """
-    return pd.read_csv(
+    notes = pd.read_csv(
         path,
         sep=None,
         engine="python",
-        index_col=False
-    ).drop(
-        columns=["end_time_s", "velocity", "pitch_bend"]
+        index_col=False,
+        usecols=["start_time_s", "end_time_s", "pitch_midi"]
     ).sort_values("start_time_s")
+    return {
+        "start": notes["start_time_s"].to_numpy(dtype=np.float32),
+        "end": notes["end_time_s"].to_numpy(dtype=np.float32),
+        "pitch": notes["pitch_midi"].to_numpy(dtype=np.int8)
+    }
 
 def preprocess_note_data(
-    notes: pd.DataFrame,
+    notes: dict[str, np.ndarray],
     slice_start: float | None = None,
     slice_end: float | None = None,
     offset_latency: bool = False
 ) -> dict[int, list]:
     """
-    Take a notes DataFrame and perform pre-processing, returning a
-    2D array containing note onset times for all 128 MIDI pitches.
+    Take note event arrays and perform pre-processing, returning a
+    dict containing note onset times for all 128 MIDI pitches.
 
     Parameters
     ----------
-    notes : DataFrame
-        The pandas DataFrame containing note event information.
+    notes : dict[str, ndarray]
+        The note event arrays (start, end, pitch), sorted by onset.
     slice_start, slice_end : float, optional
         The times in seconds to start and end time-slice.
     offset_latency : bool
@@ -130,21 +241,19 @@ def preprocess_note_data(
         A dictionary containing lists of the times in seconds of note
         onsets for every possible MIDI pitch (0-127).
     """
-    new_notes = notes.copy()
-    config = read_config("Audio")
+    start_times, pitches = notes["start"], notes["pitch"]
 
-    if slice_start and slice_end:
-        new_notes = notes[
-            (notes["start_time_s"] >= slice_start)
-            & (notes["start_time_s"] < slice_end)
-        ]
+    if slice_start is not None and slice_end is not None:
+        # Onsets are sorted, so the time-slice is a binary search
+        lo, hi = np.searchsorted(start_times, (slice_start, slice_end))
+        start_times, pitches = start_times[lo:hi], pitches[lo:hi]
 
     if offset_latency:
-        latency = config["in_latency"] + config["out_latency"]
-        new_notes["start_time_s"] -= latency
+        config = read_config("Audio")
+        start_times = start_times - (config["in_latency"] + config["out_latency"])
 
     note_sequences = {k: [] for k in range(128)}
-    for row in new_notes.itertuples():
-        note_sequences[row.pitch_midi].append(row.start_time_s)
+    for time, pitch in zip(start_times.tolist(), pitches.tolist()):
+        note_sequences[pitch].append(time)
 
     return note_sequences
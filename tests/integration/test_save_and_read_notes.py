@@ -4,12 +4,13 @@ Performs integration testing of note saving and reading functionality.
 
 import os
 import tempfile
+from pathlib import Path
 import pytest
 import numpy as np
 import pandas as pd
 from scipy.io.wavfile import write as write_wav
 from guitaraoke.save_notes import save_notes
-from guitaraoke.utils import csv_to_notes_dataframe, read_config
+from guitaraoke.utils import csv_to_notes_arrays, read_config
 from guitaraoke.preload import preload_directories
 
 preload_directories()
@@ -49,16 +50,16 @@ def test_one_note_predicted_from_monotone_audio() -> None:
     """
     # Save predicted note events
     test_notes_path = save_notes(
-        ".\\assets\\audio\\test\\C3_sine_test.wav", 
+        Path("assets") / "audio" / "test" / "C3_sine_test.wav",
         temp=True,
     )[0]
-    test_notes_events = csv_to_notes_dataframe(test_notes_path)
+    test_notes_events = csv_to_notes_arrays(test_notes_path)
 
     # Clean up
     os.remove(test_notes_path)
 
-    unique_notes = test_notes_events["pitch_midi"].unique()
-    assert unique_notes == [60]
+    unique_notes = np.unique(test_notes_events["pitch"])
+    assert unique_notes.tolist() == [60]
 
 
 def test_predicted_note_times_are_accurate() -> None:
@@ -68,15 +69,15 @@ def test_predicted_note_times_are_accurate() -> None:
     """
     # Save predicted note events
     test_notes_path = save_notes(
-        ".\\assets\\audio\\test\\1s_interval_test.wav",
+        Path("assets") / "audio" / "test" / "1s_interval_test.wav",
         temp=True,
     )[0]
-    test_notes_events = csv_to_notes_dataframe(test_notes_path)
+    test_notes_events = csv_to_notes_arrays(test_notes_path)
 
     # Clean up
     os.remove(test_notes_path)
 
-    note_start_times = test_notes_events["start_time_s"]
+    note_start_times = test_notes_events["start"]
     tolerance = 0.05
     for time in note_start_times:
         difference = np.abs(time - round(time))
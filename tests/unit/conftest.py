@@ -0,0 +1,12 @@
+"""Provides pytest fixtures shared across unit tests."""
+
+import pytest
+from guitaraoke.audio_streaming import LoadedAudio
+from guitaraoke.utils import read_config
+
+@pytest.fixture(name="loaded_audio")
+def loaded_audio_fixture() -> LoadedAudio:
+    """Create a LoadedAudio object without loading any audio file."""
+    song = LoadedAudio.__new__(LoadedAudio)
+    song.audio_config = read_config("Audio")
+    return song
@@ -0,0 +1,55 @@
+"""Performs unit testing of the LoadedAudio active_notes method."""
+
+import pytest
+import numpy as np
+from guitaraoke.audio_streaming import LoadedAudio
+
+@pytest.fixture(name="song")
+def song_fixture(loaded_audio: LoadedAudio) -> LoadedAudio:
+    """Create a LoadedAudio object with sorted note event arrays."""
+    song = loaded_audio
+    song.notes = {
+        "start": np.array([0.5, 1.0, 1.0, 2.0], dtype=np.float32),
+        "end": np.array([1.5, 1.5, 2.0, 2.5], dtype=np.float32),
+        "pitch": np.array([60, 62, 64, 65], dtype=np.int8)
+    }
+    return song
+
+
+def test_overlapping_notes_sounding(song: LoadedAudio) -> None:
+    """Assert all notes overlapping a time are returned."""
+    assert song.active_notes(1.2).tolist() == [60, 62, 64]
+
+
+def test_note_onset_at_time(song: LoadedAudio) -> None:
+    """Assert notes starting exactly at a time are sounding."""
+    assert song.active_notes(1.0).tolist() == [60, 62, 64]
+
+
+def test_note_release_at_time(song: LoadedAudio) -> None:
+    """
+    Assert notes ending exactly at a time are not sounding, while notes
+    starting at that time are.
+    """
+    assert song.active_notes(1.5).tolist() == [64]
+    assert song.active_notes(2.0).tolist() == [65]
+
+
+def test_no_notes_sounding(song: LoadedAudio) -> None:
+    """
+    Assert no notes are returned before the first onset or after the
+    last release.
+    """
+    assert song.active_notes(0.0).size == 0
+    assert song.active_notes(3.0).size == 0
+
+
+def test_empty_notes(loaded_audio: LoadedAudio) -> None:
+    """Assert a song with no note events has no sounding notes."""
+    song = loaded_audio
+    song.notes = {
+        "start": np.array([], dtype=np.float32),
+        "end": np.array([], dtype=np.float32),
+        "pitch": np.array([], dtype=np.int8)
+    }
+    assert song.active_notes(1.0).size == 0
@@ -84,3 +84,62 @@ def test_outside_note_hit_window(
     results = compare_notes(user_notes, song_notes)
     notes_hit, total_notes = results[1], results[2]
     assert notes_hit/total_notes == 0
+
+
+def test_user_note_matched_once(
+    note_dicts: tuple[dict[int, list], dict[int, list]]
+) -> None:
+    """
+    Assert a user note near two song notes is only matched to one of
+    them.
+    """
+    user_notes, song_notes = note_dicts
+
+    user_notes[52] = [0.705]
+
+    song_notes[52] = [0.7, 0.71]
+
+    results = compare_notes(user_notes, song_notes)
+    notes_hit, total_notes = results[1], results[2]
+    assert notes_hit == 1 and total_notes == 2
+
+
+def test_notes_matched_for_best_total_score(
+    note_dicts: tuple[dict[int, list], dict[int, list]]
+) -> None:
+    """
+    Assert song notes competing for the same nearest user note are
+    matched so that both can score, rather than the nearest pair
+    taking it and leaving the other song note missed.
+    """
+    user_notes, song_notes = note_dicts
+    hit_window = config["note_hit_window"]
+
+    user_notes[55] = [0.9*hit_window, 2.5*hit_window]
+
+    song_notes[55] = [0.0, 1.0*hit_window]
+
+    results = compare_notes(user_notes, song_notes)
+    notes_hit, total_notes, swing = results[1], results[2], results[3]
+    assert notes_hit == 2 - config["close_hit_penalty"] and total_notes == 2
+    assert swing == pytest.approx([0.9*hit_window, 1.5*hit_window])
+
+
+def test_far_note_does_not_split_scoring_pair(
+    note_dicts: tuple[dict[int, list], dict[int, list]]
+) -> None:
+    """
+    Assert a user note far outside the hit window does not pull a
+    scoring pair apart to reduce its own distance from a song note.
+    """
+    user_notes, song_notes = note_dicts
+    hit_window = config["note_hit_window"]
+
+    user_notes[48] = [1.2*hit_window, 100*hit_window]
+
+    song_notes[48] = [0.0, 2.1*hit_window]
+
+    results = compare_notes(user_notes, song_notes)
+    notes_hit, total_notes, swing = results[1], results[2], results[3]
+    assert notes_hit == 1 and total_notes == 2
+    assert swing == pytest.approx([-0.9*hit_window])
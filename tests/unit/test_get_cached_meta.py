@@ -0,0 +1,72 @@
+"""Performs unit testing of the LoadedAudio _get_cached_meta method."""
+
+import json
+from pathlib import Path
+import pytest
+from guitaraoke.audio_streaming import LoadedAudio
+from guitaraoke.utils import file_hash
+
+@pytest.fixture(name="song")
+def song_fixture(
+    loaded_audio: LoadedAudio,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> LoadedAudio:
+    """
+    Create a LoadedAudio object for a song file with saved separated
+    tracks and notes in a temporary directory.
+    """
+    monkeypatch.setenv("saved_notes_dir", str(tmp_path / "notes"))
+    (tmp_path / "notes" / "songs" / "song.wav").mkdir(parents=True)
+    song = loaded_audio
+    song.path = tmp_path / "song.wav"
+    song.path.write_bytes(b"song")
+    song.metadata = {"filename": "song.wav"}
+    song.sep_dir = tmp_path / "separated" / "song"
+    song.sep_dir.mkdir(parents=True)
+    for name in ("guitar.wav", "no_guitar.wav", "full_mix.npy"):
+        (song.sep_dir / name).write_bytes(b"track")
+    return song
+
+
+def test_tracks_without_meta_kept(song: LoadedAudio) -> None:
+    """
+    Assert separated tracks saved without metadata are kept, while
+    their decoded tracks are removed.
+    """
+    meta = song._get_cached_meta(song.path) # pylint: disable=protected-access
+
+    assert not meta
+    assert (song.sep_dir / "guitar.wav").exists()
+    assert (song.sep_dir / "no_guitar.wav").exists()
+    assert not (song.sep_dir / "full_mix.npy").exists()
+
+
+def test_incomplete_tracks_without_meta_deleted(song: LoadedAudio) -> None:
+    """Assert a partial separation saved without metadata is deleted."""
+    (song.sep_dir / "no_guitar.wav").unlink()
+    meta = song._get_cached_meta(song.path) # pylint: disable=protected-access
+
+    assert not meta
+    assert not song.sep_dir.exists()
+
+
+def test_matching_meta_kept(song: LoadedAudio) -> None:
+    """Assert saved data made from the same file is kept."""
+    saved_meta = {"source_hash": file_hash(song.path), "rate": song.audio_config["rate"]}
+    (song.sep_dir / "meta.json").write_text(json.dumps(saved_meta), encoding="utf-8")
+    meta = song._get_cached_meta(song.path) # pylint: disable=protected-access
+
+    assert meta == saved_meta
+    assert (song.sep_dir / "full_mix.npy").exists()
+
+
+def test_mismatched_meta_deleted(song: LoadedAudio, tmp_path: Path) -> None:
+    """Assert saved data made from a different file is deleted."""
+    saved_meta = {"source_hash": "0" * 16, "rate": song.audio_config["rate"]}
+    (song.sep_dir / "meta.json").write_text(json.dumps(saved_meta), encoding="utf-8")
+    meta = song._get_cached_meta(song.path) # pylint: disable=protected-access
+
+    assert not meta
+    assert not song.sep_dir.exists()
+    assert not (tmp_path / "notes" / "songs" / "song.wav").exists()
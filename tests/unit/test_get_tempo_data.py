@@ -0,0 +1,40 @@
+"""Performs unit testing of the LoadedAudio _get_tempo_data method."""
+
+import numpy as np
+from guitaraoke.audio_streaming import LoadedAudio, DEFAULT_BPM
+from guitaraoke.utils import read_config
+
+config = read_config("Audio")
+
+
+def test_silent_audio_uses_default_tempo(loaded_audio: LoadedAudio) -> None:
+    """
+    Assert silent audio falls back to the default tempo with the first
+    beat at the start of the song.
+    """
+    silence = np.zeros(5*config["rate"], dtype=np.float32) # 5 seconds
+    bpm, first_beat = loaded_audio._get_tempo_data(silence, {}) # pylint: disable=protected-access
+
+    assert bpm == DEFAULT_BPM
+    assert first_beat == 0.0
+
+
+def test_quiet_noise_has_usable_tempo(loaded_audio: LoadedAudio) -> None:
+    """
+    Assert very quiet noise is scaled up enough for a tempo to be
+    detected, rather than falling back to the default tempo.
+    """
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 1e-6, 5*config["rate"]).astype(np.float32)
+    bpm, first_beat = loaded_audio._get_tempo_data(noise, {}) # pylint: disable=protected-access
+
+    assert bpm > 0 and bpm != DEFAULT_BPM
+    assert first_beat >= 0
+
+
+def test_cached_zero_tempo_is_recomputed(loaded_audio: LoadedAudio) -> None:
+    """Assert a saved tempo of zero is not reused from song metadata."""
+    silence = np.zeros(5*config["rate"], dtype=np.float32)
+    bpm, _ = loaded_audio._get_tempo_data(silence, {"bpm": 0, "first_beat": 0}) # pylint: disable=protected-access
+
+    assert bpm == DEFAULT_BPM
@@ -1 +1,44 @@
 """Performs unit testing of the preprocess_note_data function."""
+
+import pytest
+import numpy as np
+from guitaraoke.utils import preprocess_note_data
+
+@pytest.fixture(name="notes")
+def notes_fixture() -> dict[str, np.ndarray]:
+    """Create sorted note event arrays for testing."""
+    return {
+        "start": np.array([0.5, 1.0, 1.5, 2.0], dtype=np.float32),
+        "end": np.array([0.9, 1.4, 1.9, 2.4], dtype=np.float32),
+        "pitch": np.array([60, 62, 60, 64], dtype=np.int8)
+    }
+
+
+def test_notes_grouped_by_pitch(notes: dict[str, np.ndarray]) -> None:
+    """Assert note onset times are grouped under their MIDI pitch."""
+    note_sequences = preprocess_note_data(notes)
+
+    assert len(note_sequences) == 128
+    assert note_sequences[60] == [0.5, 1.5]
+    assert note_sequences[62] == [1.0]
+    assert note_sequences[64] == [2.0]
+
+
+def test_time_slice_bounds(notes: dict[str, np.ndarray]) -> None:
+    """
+    Assert a time-slice includes notes starting at its start time and
+    excludes notes starting at its end time.
+    """
+    note_sequences = preprocess_note_data(notes, slice_start=1.0, slice_end=2.0)
+
+    assert note_sequences[60] == [1.5]
+    assert note_sequences[62] == [1.0]
+    assert not note_sequences[64]
+
+
+def test_time_slice_from_zero(notes: dict[str, np.ndarray]) -> None:
+    """Assert a time-slice starting at zero seconds is applied."""
+    note_sequences = preprocess_note_data(notes, slice_start=0.0, slice_end=1.0)
+
+    assert note_sequences[60] == [0.5]
+    assert not note_sequences[62]